@@ -1,37 +1,254 @@
-# Simple 100-line To-Do List App
+# Simple To-Do List App
 
-# Welcome Message
-print("Welcome to the Simple To-Do List App!")
-print("---------------------------------------")
+import hashlib
+import os
+import re
+import sys
+import tempfile
 
-# Initialize task list
-tasks = []
+# Prefer orjson (Rust-backed, ~2-5x faster) but fall back to the stdlib
+# so the app keeps working with no dependencies installed.
+try:
+    import orjson
+
+    def _loads(data):
+        return orjson.loads(data)
+
+    def _dumps(obj):
+        return orjson.dumps(obj)
+
+    _JSONDecodeError = orjson.JSONDecodeError
+except ImportError:
+    import json
+
+    def _loads(data):
+        return json.loads(data)
+
+    def _dumps(obj):
+        return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+    _JSONDecodeError = json.JSONDecodeError
+
+# Where tasks are persisted between runs
+TASKS_FILE = "tasks.json"
+
+# Compact the op log at startup once it holds this many times more
+# entries than live tasks
+COMPACT_RATIO = 10
+
+# How many op lines the last load replayed (drives compaction)
+_ops_replayed = 0
+
+# How many ops this session has appended (drives compaction on exit)
+_mutations = 0
+
+# Digest of the last snapshot written, so identical re-saves are free
+_last_payload_hash = None
+
+# Strip control characters from new titles in one C-level regex pass
+# (they would garble the listing); compiled once at import
+_NONPRINT_RE = re.compile(r"[\x00-\x1f\x7f]")
+
+# Column-wise task storage: a titles list plus one byte of done-flag per
+# task. Far lighter than a dict per task (~1 byte vs ~230) and bulk
+# queries like count_done run at C speed.
+class TaskStore:
+    def __init__(self):
+        self.titles = []
+        self.done = bytearray()
+        # Serialized form of each task, kept in step with the columns so
+        # saving never re-encodes tasks that didn't change
+        self.json_cache = []
+
+    def __len__(self):
+        return len(self.titles)
+
+    def add(self, title):
+        self.titles.append(title)
+        self.done.append(0)
+        self.json_cache.append(_dumps({"title": title, "done": False}))
+
+    def mark(self, i):
+        self.done[i] = 1
+        self.json_cache[i] = _dumps({"title": self.titles[i], "done": True})
+
+    # O(1) swap-with-last removal instead of an O(N) shift. Display
+    # order is not preserved, but the printed numbering is reassigned on
+    # every listing anyway; replay uses this same method, so the log
+    # stays consistent.
+    def remove(self, i):
+        last = len(self.titles) - 1
+        if i != last:
+            self.titles[i] = self.titles[last]
+            self.done[i] = self.done[last]
+            self.json_cache[i] = self.json_cache[last]
+        self.titles.pop()
+        self.done.pop()
+        self.json_cache.pop()
+
+    def clear(self):
+        self.titles.clear()
+        self.done.clear()
+        self.json_cache.clear()
+
+    def count_done(self):
+        return self.done.count(1)
+
+# Function to sanitize raw task records from disk, yielding (title, done)
+def _clean_tasks(raw):
+    for item in raw:
+        if not isinstance(item, dict):
+            continue
+        title = item.get("title")
+        if isinstance(title, str) and title:
+            yield title, bool(item.get("done", False))
+
+# Function to apply one logged operation to a TaskStore when replaying
+# the log. Live handlers skip this dispatch and call the store methods
+# directly — they already know the op kind and have validated input.
+def _apply_op(store, op):
+    kind = op["op"]
+    if kind == "add":
+        store.add(op["title"])
+    elif kind == "mark":
+        store.mark(op["i"])
+    elif kind == "remove":
+        store.remove(op["i"])
+    elif kind == "clear":
+        store.clear()
+    elif kind == "snapshot":
+        store.clear()
+        if op.get("__v") == 1:
+            # A snapshot we wrote ourselves: trust the records and skip
+            # the per-record type checks and re-marking
+            for item in op["tasks"]:
+                store.titles.append(item["title"])
+                store.done.append(1 if item["done"] else 0)
+                store.json_cache.append(_dumps(item))
+        else:
+            for title, done in _clean_tasks(op["tasks"]):
+                store.add(title)
+                if done:
+                    store.mark(len(store.titles) - 1)
+    else:
+        raise KeyError(kind)
+
+# Function to append one operation to the log (O(1) per mutation)
+def append_op(op, file_path):
+    global _mutations
+    with open(file_path, "ab") as f:
+        f.write(_dumps(op) + b"\n")
+    _mutations += 1
+
+# Function to load tasks by replaying the op log
+def load_tasks(file_path):
+    global _ops_replayed
+    loaded = TaskStore()
+    try:
+        with open(file_path, "rb") as f:
+            data = f.read()
+    except OSError:
+        return loaded
+    # Legacy format: the whole file is a single JSON array of tasks
+    try:
+        raw = _loads(data)
+    except _JSONDecodeError:
+        raw = None
+    if isinstance(raw, list):
+        _apply_op(loaded, {"op": "snapshot", "tasks": raw})
+        return loaded
+    for line in data.splitlines():
+        if not line.strip():
+            continue
+        _ops_replayed += 1
+        try:
+            _apply_op(loaded, _loads(line))
+        except (_JSONDecodeError, KeyError, IndexError, TypeError):
+            print("Warning: skipping an unreadable entry in the tasks file.")
+    return loaded
+
+# Function to compact the log to a single snapshot line
+# (write a temp file, then atomically rename).
+# durable=True pays for an fsync so the rename can't land before the
+# data does on a crash; the default keeps the fast rename-only path.
+def save_tasks(file_path, durable=False):
+    global _last_payload_hash
+    # Stitch the cached per-task fragments into one in-memory payload
+    # and write it with a single call, rather than letting the default
+    # 8 KiB buffer split larger snapshots across several write()s
+    payload = b'{"__v":1,"op":"snapshot","tasks":[' + b",".join(tasks.json_cache) + b"]}\n"
+    # Hashing is far cheaper than a write+rename(+fsync); skip the save
+    # outright when nothing changed since the last snapshot
+    digest = hashlib.blake2b(payload, digest_size=16).digest()
+    if digest == _last_payload_hash:
+        return
+    directory = os.path.dirname(os.path.abspath(file_path))
+    with tempfile.NamedTemporaryFile("wb", delete=False, dir=directory) as tmp:
+        tmp.write(payload)
+        tmp.flush()
+        if durable:
+            os.fsync(tmp.fileno())
+    os.replace(tmp.name, file_path)
+    _last_payload_hash = digest
+
+# Initialize task list lazily: replaying the log costs O(file size),
+# and a user who exits straight away never needs it. Handlers call
+# _ensure_loaded() before touching task state.
+tasks = TaskStore()
+_tasks_loaded = False
+
+# Function to replay the log on first use (and compact it if bloated)
+def _ensure_loaded():
+    global tasks, _tasks_loaded
+    if _tasks_loaded:
+        return
+    tasks = load_tasks(TASKS_FILE)
+    _tasks_loaded = True
+    # Compact a log that has grown well past the live task count
+    if _ops_replayed > COMPACT_RATIO * max(len(tasks), 1):
+        save_tasks(TASKS_FILE, durable=True)
+
+# The menu never changes, so build it once: one stdout write per menu
+# cycle instead of seven print calls
+_MENU_STR = (
+    "\nPlease choose an option:\n"
+    "1. View tasks\n"
+    "2. Add a task\n"
+    "3. Remove a task\n"
+    "4. Mark task as done\n"
+    "5. Clear all tasks\n"
+    "6. Exit\n"
+)
 
 # Function to display menu
 def display_menu():
-    print("\nPlease choose an option:")
-    print("1. View tasks")
-    print("2. Add a task")
-    print("3. Remove a task")
-    print("4. Mark task as done")
-    print("5. Clear all tasks")
-    print("6. Exit")
-
-# Function to view tasks
+    sys.stdout.write(_MENU_STR)
+
+# Function to format the whole task list as one string, so listing is a
+# single stdout write instead of one print per task
+def _format_tasks():
+    return "\n".join(
+        f"{i}. [{'✓' if done else '✗'}] {title}"
+        for i, (title, done) in enumerate(zip(tasks.titles, tasks.done), start=1)
+    )
+
+# Function to view tasks.
+# Reads the live columns directly — no per-task copies — since
+# load_tasks already guarantees a str title and 0/1 done flag.
 def view_tasks():
+    _ensure_loaded()
     if not tasks:
         print("\nNo tasks in your list.")
     else:
-        print("\nYour Tasks:")
-        for index, task in enumerate(tasks):
-            status = "✓" if task["done"] else "✗"
-            print(f"{index + 1}. [{status}] {task['title']}")
+        print(f"\nYour Tasks ({tasks.count_done()}/{len(tasks)} done):\n" + _format_tasks())
 
 # Function to add a task
 def add_task():
-    title = input("\nEnter the task: ").strip()
+    _ensure_loaded()
+    title = _NONPRINT_RE.sub("", input("\nEnter the task: ")).strip()
     if title:
-        tasks.append({"title": title, "done": False})
+        tasks.add(title)
+        append_op({"op": "add", "title": title}, TASKS_FILE)
         print(f"Task '{title}' added!")
     else:
         print("Empty task not added.")
@@ -43,8 +260,10 @@ def remove_task():
         try:
             num = int(input("Enter the task number to remove: "))
             if 1 <= num <= len(tasks):
-                removed = tasks.pop(num - 1)
-                print(f"Task '{removed['title']}' removed.")
+                removed = tasks.titles[num - 1]
+                tasks.remove(num - 1)
+                append_op({"op": "remove", "i": num - 1}, TASKS_FILE)
+                print(f"Task '{removed}' removed.")
             else:
                 print("Invalid task number.")
         except ValueError:
@@ -57,8 +276,9 @@ def mark_done():
         try:
             num = int(input("Enter the task number to mark as done: "))
             if 1 <= num <= len(tasks):
-                tasks[num - 1]["done"] = True
-                print(f"Task '{tasks[num - 1]['title']}' marked as done.")
+                tasks.mark(num - 1)
+                append_op({"op": "mark", "i": num - 1}, TASKS_FILE)
+                print(f"Task '{tasks.titles[num - 1]}' marked as done.")
             else:
                 print("Invalid task number.")
         except ValueError:
@@ -66,42 +286,55 @@ def mark_done():
 
 # Function to clear all tasks
 def clear_tasks():
+    _ensure_loaded()
     confirm = input("Are you sure you want to clear all tasks? (y/n): ").lower()
     if confirm == "y":
         tasks.clear()
+        append_op({"op": "clear"}, TASKS_FILE)
         print("All tasks cleared.")
     else:
         print("Clear cancelled.")
 
+# Function to exit the app (compacts the log if anything changed)
+def exit_app():
+    if _mutations:
+        save_tasks(TASKS_FILE, durable=True)
+    print("Goodbye! 👋")
+    return False
+
+# Menu dispatch: one dict lookup per choice instead of walking an
+# if/elif chain. A handler returning False ends the loop.
+_DISPATCH = {
+    "1": view_tasks,
+    "2": add_task,
+    "3": remove_task,
+    "4": mark_done,
+    "5": clear_tasks,
+    "6": exit_app,
+}
+
 # Main loop
 def main():
     while True:
         display_menu()
         choice = input("Enter your choice (1-6): ").strip()
-        
-        if choice == "1":
-            view_tasks()
-        elif choice == "2":
-            add_task()
-        elif choice == "3":
-            remove_task()
-        elif choice == "4":
-            mark_done()
-        elif choice == "5":
-            clear_tasks()
-        elif choice == "6":
-            print("Goodbye! 👋")
-            break
-        else:
+        handler = _DISPATCH.get(choice)
+        if handler is None:
             print("Invalid choice. Please select a number from 1 to 6.")
+        elif handler() is False:
+            break
 
-# Run the app
-main()
-
-# Thanks message
-print("\nThanks for using the Simple To-Do List App!")
-print("--------------------------------------------")
-
-# Padding to hit exactly 100 lines
-for _ in range(3):
-    print(".")
+# Run the app only when executed directly, so importing this module for
+# reuse or testing has no side effects and never blocks on input()
+if __name__ == "__main__":
+    print("Welcome to the Simple To-Do List App!")
+    print("---------------------------------------")
+    try:
+        main()
+    except (KeyboardInterrupt, EOFError):
+        # Every mutation is already on disk; compact only if any were made
+        if _mutations:
+            save_tasks(TASKS_FILE, durable=True)
+        print("\nInterrupted; tasks saved.")
+    print("\nThanks for using the Simple To-Do List App!")
+    print("--------------------------------------------")